@@ -24,75 +24,346 @@ import tkinter as tk
 from tkinter import ttk  # Import the themed tkinter module
 from tkinter import font as tkfont  # Import the font module
 from tkinter import filedialog, messagebox
+import array
+import concurrent.futures
 import csv
+import hashlib
+import io
+import itertools
 import json
 import os
-from typing import List, Tuple, Any, Optional, Callable
+from time import monotonic
+from math import ceil, floor
+from typing import List, Tuple, Any, Optional, Callable, Iterable, Iterator, Union
 import subprocess
 
+try:
+    import orjson  # optional, faster JSON encoder/decoder
+except ImportError:
+    orjson = None
+
+CSV_HEADER: List[str] = ["Task Name", "Pomodoros"]
+# largest pomodoro count the model's C int array ('i') can hold
+_MAX_POMODOROS: int = 2 ** (8 * array.array('i').itemsize - 1) - 1
+# single background thread for file saves, so slow disks never stall the UI
+_IO_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="pompompom-io")
+# read buffer for task files, so long lists are streamed with few read() calls
+_IO_BUFFER_SIZE: int = 1 << 16
+# path -> ((size, mtime_ns), rows) of task files already parsed by _read_task_file
+_task_file_cache: dict = {}
+# path -> ((size, mtime_ns), digest) of the data last written by _write_if_changed
+_written_digests: dict = {}
+
+# pre-rendered "MM:SS" strings for every second of the first two hours,
+# generated minute by minute so building the table needs no division
+_MMSS: Tuple[str, ...] = tuple(f"{m:02d}:{s:02d}" for m in range(2 * 60) for s in range(60))
+# seconds -> "MM:SS" for the (rare) values past the end of _MMSS, filled on demand
+_MMSS_EXTRA: dict = {}
+
+def _dump_json(data: dict) -> bytes:
+    """
+    Serializes data as indented JSON, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=4).encode("utf-8")
+
+def _load_json(data: bytes) -> Any:
+    """
+    Parses JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _format_tasks_csv(tasks: Iterable[Iterable[Any]]) -> str:
+    """
+    Renders the header and task rows as one CSV string, ready for a single write.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(CSV_HEADER)
+    writer.writerows(tasks)
+    return buf.getvalue()
+
+def _atomic_write(path: str, data: Union[str, bytes]) -> None:
+    """
+    Writes data to a temporary file next to path, then swaps it into place so
+    an interrupted write never leaves a truncated file behind.
+    """
+    tmp_path = path + ".tmp"
+    if isinstance(data, bytes):
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+    else:
+        with open(tmp_path, "w", newline="") as f:
+            f.write(data)
+    os.replace(tmp_path, path)
+
+def _write_if_changed(path: str, data: Union[str, bytes]) -> None:
+    """
+    Atomically writes data to path, unless this process already wrote the
+    same data there and the file has not been touched since.
+    """
+    digest = hashlib.blake2b(data.encode("utf-8") if isinstance(data, str) else data, digest_size=16).digest()
+    previous = _written_digests.get(path)
+    if previous is not None and previous[1] == digest:
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if st is not None and previous[0] == (st.st_size, st.st_mtime_ns):
+            return
+    _atomic_write(path, data)
+    st = os.stat(path)
+    _written_digests[path] = ((st.st_size, st.st_mtime_ns), digest)
+
+def _split_task_lines(lines: Iterable[str]) -> Iterator[Tuple[int, List[str]]]:
+    """
+    Splits task CSV lines (header already consumed) into (line number, fields).
+    Plain lines are split on commas directly; from the first quoted line on,
+    the rest of the file goes through csv.reader.
+    """
+    rest: Iterator[str] = iter(lines)
+    for line_no, line in enumerate(rest, start=2):
+        if '"' in line:
+            # quoted fields may hold commas, quotes or even newlines, so a
+            # row can span several lines: let the csv parser read the rest
+            reader = csv.reader(itertools.chain([line], rest))
+            row_start: int = line_no
+            for row in reader:
+                yield row_start, row
+                row_start = line_no + reader.line_num
+            return
+        yield line_no, line.rstrip("\r\n").split(',')
+
+def _iter_task_rows(lines: Iterable[str]) -> Iterator[Tuple[str, int]]:
+    """
+    Parses task CSV lines (header already consumed) into (name, pomodoros)
+    rows one at a time. Malformed rows are reported together in a single
+    ValueError once every line has been read.
+    """
+    bad_lines: List[int] = []
+    for line_no, row in _split_task_lines(lines):
+        if len(row) != 2:
+            bad_lines.append(line_no)
+            continue
+        # a single int() both validates and converts (surrounding spaces are fine)
+        try:
+            pomodoros = int(row[1])
+        except ValueError:
+            pomodoros = -1
+        if not 0 <= pomodoros <= _MAX_POMODOROS:
+            bad_lines.append(line_no)
+            continue
+        yield row[0], pomodoros
+    if bad_lines:
+        raise ValueError(f"CSV format incorrect on line(s) {', '.join(map(str, bad_lines))}. "
+                         "Each row must have a task name and a number of pomodoros.")
+
+def _read_task_file(path: str) -> Tuple[Tuple[str, int], ...]:
+    """
+    Reads and parses a whole task CSV file. The rows are cached per path and
+    reused while the file's size and modification time are unchanged.
+    """
+    st = os.stat(path)
+    key = (st.st_size, st.st_mtime_ns)
+    cached = _task_file_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(path, 'r', newline='', buffering=_IO_BUFFER_SIZE) as f:
+        next(f, None)  # skip the header
+        rows = tuple(_iter_task_rows(f))
+    _task_file_cache[path] = (key, rows)
+    return rows
+
+def _read_json_file(path: str) -> Any:
+    """
+    Reads and parses a JSON file; used off the Tk thread.
+    """
+    with open(path, 'rb') as f:
+        return _load_json(f.read())
+
 class PomodoroModel:
     """
     Manages the logic of the Pomodoro timer.
     """
+    # single long-lived instance read every tick: no per-instance __dict__
+    __slots__ = (
+        'work_duration', 'short_break_duration', 'long_break_duration',
+        'num_cyc_before_long_break', 'pomodoro_cycle', '_cycle_plan',
+        'current_state_index', 'is_running', 'remaining_time', 'current_task',
+        '_task_names', '_task_counts', 'current_task_index', '_end_time',
+        '_paused_left',
+    )
+
+    # state -> (name of the duration attribute, fixed task text or None for Work)
+    _STATE_PLAN: dict = {
+        "Work": ("work_duration", None),
+        "Short Break": ("short_break_duration", "Short Break"),
+        "Long Break": ("long_break_duration", "Long Break"),
+    }
+
     def __init__(self) -> None:
         self.work_duration: int = 25 * 60
         self.short_break_duration: int = 5 * 60
         self.long_break_duration: int = 15 * 60
         self.num_cyc_before_long_break: int = 4
-        self.pomodoro_cycle: List[str] = ["Work", "Short Break"]*self.num_cyc_before_long_break
-        self.pomodoro_cycle.append("Long Break")
+        self.pomodoro_cycle: List[str] = []
+        self._cycle_plan: Tuple[Tuple[str, int, Optional[str]], ...] = ()
+        self.build_cycle()
         self.current_state_index: int = 0
         self.is_running: bool = False
         self.remaining_time: int = self.work_duration
         self.current_task: str = "No Task Selected"
-        self.task_list: List[List[str | int]] = []
+        # task list stored column-wise: names plus a C int array of remaining pomodoros
+        self._task_names: List[str] = []
+        self._task_counts: array.array = array.array('i')
         self.current_task_index: int = -1 # Start at -1 to handle the first task correctly
+        self._end_time: Optional[float] = None # monotonic deadline of the running state
+        # exact seconds left when paused mid-state; remaining_time only holds the
+        # whole seconds shown, so resuming from it would hand back the fraction
+        self._paused_left: Optional[float] = None
+
+    @property
+    def task_list(self) -> List[List[Union[str, int]]]:
+        """
+        The tasks as [name, pomodoros] rows. This is a fresh copy; use the
+        setter or move_task() to change the model.
+        """
+        return [[name, count] for name, count in zip(self._task_names, self._task_counts)]
+
+    @task_list.setter
+    def task_list(self, tasks: Iterable[Iterable[Any]]) -> None:
+        names: List[str] = []
+        counts: array.array = array.array('i')
+        for name, count in tasks:
+            names.append(str(name))
+            counts.append(int(count))
+        self._task_names = names
+        self._task_counts = counts
+
+    def iter_tasks(self) -> Iterator[Tuple[str, int]]:
+        """
+        Yields (name, pomodoros) pairs straight from the task columns, without
+        building the row lists that task_list returns.
+        """
+        return zip(self._task_names, self._task_counts)
+
+    def task_at(self, index: int) -> Tuple[str, int]:
+        """
+        Returns the (name, pomodoros) pair of the task at index.
+        """
+        return self._task_names[index], self._task_counts[index]
+
+    @property
+    def num_tasks(self) -> int:
+        """
+        Number of tasks in the task list.
+        """
+        return len(self._task_names)
+
+    def move_task(self, src: int, dst: int) -> None:
+        """
+        Moves the task at index src to index dst.
+        """
+        self._task_names.insert(dst, self._task_names.pop(src))
+        self._task_counts.insert(dst, self._task_counts.pop(src))
+
+    def build_cycle(self) -> None:
+        """
+        Rebuilds the state cycle (num_cyc_before_long_break Work/Short Break
+        pairs followed by a Long Break) and its precomputed (state, duration,
+        task text) plan. Call again after changing any of the durations.
+        """
+        states: Tuple[str, ...] = ("Work", "Short Break")*self.num_cyc_before_long_break + ("Long Break",)
+        plan: dict = {
+            state: (state, getattr(self, duration_attr), task_text)
+            for state, (duration_attr, task_text) in self._STATE_PLAN.items()
+        }
+        self._cycle_plan = tuple(plan[state] for state in states)
+        # reuse the plan's label objects, so the view's "state changed?"
+        # comparison is an identity check for repeated states
+        self.pomodoro_cycle = [entry[0] for entry in self._cycle_plan]
 
     def get_next_state(self) -> Tuple[str, int, str]:
         """
         Determines the next state in the Pomodoro cycle.
         """
-        self.current_state_index = (self.current_state_index + 1) % len(self.pomodoro_cycle)
-        state = self.pomodoro_cycle[self.current_state_index]
-        if state == "Work":
-            self.remaining_time = self.work_duration
-            if self.task_list:
-                if self.current_task_index == -1:
-                    self.current_task_index = (self.current_task_index + 1)
-
-                elif self.task_list[self.current_task_index][1] != 0: 
-                    self.task_list[self.current_task_index][1] -= 1
-
-                if self.task_list[self.current_task_index][1] == 0:
-                    self.current_task_index = (self.current_task_index + 1) % len(self.task_list)
-                
-                if self.task_list[self.current_task_index][1] != 0:
-                    self.current_task = self.task_list[self.current_task_index][0]
-                else:
-                    self.current_task = "All Tasks Completed"
-            else:
-                self.current_task = "No Task Selected"
-        elif state == "Short Break":
-            self.remaining_time = self.short_break_duration
-            self.current_task = "Short Break"
-        elif state == "Long Break":
-            self.remaining_time = self.long_break_duration
-            self.current_task = "Long Break"
+        # wrap with a compare rather than a modulo; the cycle length is user-set
+        # (num_cyc_before_long_break), so it cannot be a fixed bit mask
+        index: int = self.current_state_index + 1
+        if index >= len(self._cycle_plan):
+            index = 0
+        self.current_state_index = index
+        state, self.remaining_time, task_text = self._cycle_plan[index]
+        self._paused_left = None
+        if task_text is None:
+            self._advance_task()
+        else:
+            self.current_task = task_text
+        if self.is_running:
+            self._end_time = monotonic() + self.remaining_time
         return state, self.remaining_time, self.current_task
 
+    def _advance_task(self) -> None:
+        """
+        Counts the finished Work session against the current task and moves
+        on to the next task that still has pomodoros left, wrapping around.
+        """
+        counts = self._task_counts
+        num_tasks: int = len(counts)
+        if not num_tasks:
+            self.current_task = "No Task Selected"
+            return
+        index: int = self.current_task_index
+        if not 0 <= index < num_tasks:
+            index = 0 # first Work session, or the list shrank under us
+        elif counts[index] > 0:
+            counts[index] -= 1
+        for step in range(num_tasks):
+            candidate: int = (index + step) % num_tasks
+            if counts[candidate] > 0:
+                self.current_task_index = candidate
+                self.current_task = self._task_names[candidate]
+                break
+        else:
+            self.current_task_index = index
+            self.current_task = "All Tasks Completed"
+
     def start(self) -> None:
         """
         Starts the Pomodoro timer.
         """
         if not self.is_running:
             self.is_running = True
+            left: float = self.remaining_time if self._paused_left is None else self._paused_left
+            self._end_time = monotonic() + left
+            self._paused_left = None
 
 
     def toggle_pause(self) -> None:
         """
         Toggles the running state of the timer.
         """
-        self.is_running = not self.is_running
+        if self.is_running:
+            self._paused_left = self.time_left()
+            self.remaining_time = ceil(self._paused_left)
+            self._end_time = None
+            self.is_running = False
+        else:
+            self.start()
+
+    def time_left(self) -> float:
+        """
+        Returns the seconds left in the current state, measured against the
+        monotonic clock while the timer is running.
+        """
+        if self._end_time is None:
+            if self._paused_left is not None:
+                return self._paused_left
+            return float(self.remaining_time)
+        return max(0.0, self._end_time - monotonic())
 
     def reset_pomodoro(self) -> Tuple[str, int, str]:
         """
@@ -101,8 +372,10 @@ class PomodoroModel:
         self.current_state_index = 0
         self.remaining_time = self.work_duration
         self.is_running = False
-        if self.task_list and 0 <= self.current_task_index < len(self.task_list):
-            self.current_task = self.task_list[self.current_task_index][0]
+        self._end_time = None
+        self._paused_left = None
+        if 0 <= self.current_task_index < len(self._task_names):
+            self.current_task = self._task_names[self.current_task_index]
         else:
             self.current_task = "No Task Selected"
         return self.pomodoro_cycle[self.current_state_index], self.remaining_time, self.current_task
@@ -111,7 +384,7 @@ class PomodoroModel:
         """
         Selects a specific task from the task list and resets the Pomodoro.
         """
-        if 0 <= task_index < len(self.task_list):
+        if 0 <= task_index < len(self._task_names):
             self.current_task_index = task_index
             self.reset_pomodoro()
 
@@ -163,6 +436,11 @@ class PomodoroView:
         self._orig_height: int = 0
         self._resizing: bool = False
         self._resize_border: int = 8  # pixels
+        self._resize_after_id: Optional[str] = None  # pending debounced font rescale
+        self._cursor_state: str = ""  # cursor currently set on the root window
+        # latest ("size"|"pos", a, b) requested by _on_drag, applied at idle time
+        self._last_geom: Tuple[Any, ...] = ()
+        self._drag_pending: bool = False
 
         self.root.bind('<ButtonPress-1>', self._on_press)
         self.root.bind('<B1-Motion>', self._on_drag)
@@ -185,6 +463,8 @@ class PomodoroView:
 
         # flash overlay handle
         self._flash_overlay: Optional[tk.Frame] = None
+        # run by _on_quit before the window is destroyed (see set_on_quit_callback)
+        self._on_quit_callback: Optional[Callable[[], None]] = None
 
         # store filenames
         self.config_filename: str = "config.json"
@@ -192,33 +472,65 @@ class PomodoroView:
 
         display_frame: tk.Frame = tk.Frame(root)
         display_frame.pack(pady=10, padx=20, fill="both", expand=True)
+        # the frame is sized by the root window, so label text changes on a
+        # tick do not need to propagate a new requested size past it
+        display_frame.pack_propagate(False)
 
-        self.task_label: tk.Label = tk.Label(display_frame, text="", font=self.task_font, justify=tk.LEFT)
+        # labels follow Tcl variables, so update_display only has to set them
+        self.time_var: tk.StringVar = tk.StringVar(root, value="")
+        self.state_var: tk.StringVar = tk.StringVar(root, value="")
+        self.task_var: tk.StringVar = tk.StringVar(root, value="")
+
+        self.task_label: tk.Label = tk.Label(display_frame, textvariable=self.task_var, font=self.task_font, justify=tk.LEFT)
         self.task_label.pack(side=tk.LEFT, fill="y", padx=(0, 10), expand=False)
 
         timer_state_frame: tk.Frame = tk.Frame(display_frame)
         timer_state_frame.pack(side=tk.RIGHT, fill="y", expand=False)
 
-        self.time_label: tk.Label = tk.Label(timer_state_frame, text="", font=self.time_font)
+        self.time_label: tk.Label = tk.Label(timer_state_frame, textvariable=self.time_var, font=self.time_font)
         self.time_label.pack(expand=True)
 
-        self.state_label: tk.Label = tk.Label(timer_state_frame, text="", font=self.state_font)
+        self.state_label: tk.Label = tk.Label(timer_state_frame, textvariable=self.state_var, font=self.state_font)
         self.state_label.pack(expand=True)
 
+        # last values rendered by update_display, used to skip no-op label updates
+        self._last_shown_time: Optional[int] = None
+        self._last_state_text: Optional[str] = None
+        self._last_task_text: Optional[str] = None
+
         self.menu: Optional[tk.Menu] = None
+        # secondary windows are built on first use, then hidden and reused
         self.task_window: Optional[tk.Toplevel] = None
-        self.spreadsheet: Optional[List[List[tk.Entry]]] = None
+        self._select_window: Optional[tk.Toplevel] = None
+        self._settings_window: Optional[tk.Toplevel] = None
+        self._settings_vars: Optional[Tuple[tk.StringVar, tk.StringVar, tk.StringVar, tk.StringVar]] = None
+        self.spreadsheet: Optional[ttk.Treeview] = None
+        self._spreadsheet_rows: int = 0
+        self._spreadsheet_dirty: bool = False  # False while the tree has no rows yet
+        # (row id, column id) of cells typed into since the tree mirrored the model
+        self._edited_cells: set = set()
+        # single in-place editor reused for every spreadsheet cell
+        self._cell_editor: Optional[tk.Entry] = None
+        self._cell_target: Optional[Tuple[str, str]] = None
         # task list UI & drag state (used by task-list window)
         self.task_listbox: Optional[tk.Listbox] = None
         self._task_drag_index: Optional[int] = None
         self._task_dragging: bool = False
 
-        self.create_right_click_menu()
+        # the right-click menu itself is built on first use (see show_menu)
+        self.root.bind("<Button-3>", self.show_menu)
+
+        # register the timer callback with Tcl once; root.after() would wrap
+        # and register a fresh command for every single tick
+        self._timer_command: str = self.root.register(self.update_timer)
+        # bound once: every tick schedules through it
+        self._tk_call: Callable[..., Any] = self.root.tk.call
+        # id of the pending tick; None while paused so the event loop can sleep
+        self._tick_id: Optional[str] = None
 
         self.model.reset_pomodoro()
         self.update_display()
-        self.update_timer()
-        self.model.start()
+        self._start_timer()
 
         # Trigger it once to set initial wraplength
         self.root.update_idletasks()
@@ -245,13 +557,32 @@ class PomodoroView:
         if self._resizing:
             dx = event.x_root - self._start_x
             dy = event.y_root - self._start_y
-            new_width = max(self._orig_width + dx, self.root.minsize()[0])
-            new_height = max(self._orig_height + dy, self.root.minsize()[1])
-            self.root.geometry(f"{int(new_width)}x{int(new_height)}")
+            min_width, min_height = self.root.minsize()
+            new_width = max(self._orig_width + dx, min_width)
+            new_height = max(self._orig_height + dy, min_height)
+            geom = ("size", int(new_width), int(new_height))
         else:
             x = self.root.winfo_x() + (event.x - self._start_x)
             y = self.root.winfo_y() + (event.y - self._start_y)
-            self.root.geometry(f"+{x}+{y}")
+            geom = ("pos", x, y)
+        last = self._last_geom
+        # ignore sub-2px jitter from fine-grained pointers; the offset keeps
+        # accumulating, so the window still catches up on the next event
+        if last and last[0] == geom[0] and abs(geom[1] - last[1]) + abs(geom[2] - last[2]) < 2:
+            return
+        self._last_geom = geom
+        # coalesce a burst of motion events into one geometry call
+        if not self._drag_pending:
+            self._drag_pending = True
+            self.root.after_idle(self._flush_drag)
+
+    def _flush_drag(self) -> None:
+        self._drag_pending = False
+        kind, a, b = self._last_geom
+        if kind == "size":
+            self.root.geometry(f"{a}x{b}")
+        else:
+            self.root.geometry(f"+{a}+{b}")
 
     def _on_release(self, event: tk.Event) -> None:
         self._resizing = False
@@ -262,19 +593,32 @@ class PomodoroView:
         height = self.root.winfo_height()
         if width - x < self._resize_border and height - y < self._resize_border:
             # use a common, widely-supported cursor name for bottom-right corner
-            try:
-                self.root.config(cursor="bottom_right_corner")
-            except tk.TclError:
-                self.root.config(cursor="arrow")
+            want = "bottom_right_corner"
         else:
-            self.root.config(cursor="")
+            want = ""
+        # only touch the window when entering or leaving the resize corner
+        if want == self._cursor_state:
+            return
+        try:
+            self.root.config(cursor=want)
+        except tk.TclError:
+            self.root.config(cursor="arrow")
+        self._cursor_state = want
 
     # --- Method to handle window resizing and scale fonts ---
     def _on_resize(self, event: tk.Event) -> None:
+        # <Configure> arrives in bursts while the window is dragged; rescale
+        # once the burst has settled instead of on every event
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(60, self._apply_resize)
+
+    def _apply_resize(self) -> None:
+        self._resize_after_id = None
         height : int = self.root.winfo_height()
         width : int = self.root.winfo_width()
 
-        if width == self.width:
+        if width == self.width and height == self.height:
             return  # No change in size
 
         # Calculate scale factor based on height change
@@ -299,7 +643,10 @@ class PomodoroView:
         self.height = height
 
     def create_right_click_menu(self) -> None:
-        self.menu = tk.Menu(self.root, tearoff=0)
+        # build the menu once; later calls reuse it instead of leaking Tcl commands
+        if self.menu is not None:
+            return
+        self.menu = tk.Menu(self.root, tearoff=0, postcommand=self._update_menu_state)
         self.menu.add_command(label="Next Pomodoro", command=self.next_pomodoro)
         self.menu.add_command(label="Pause/Resume", command=self.pause_pomodoro)
         self.menu.add_separator()
@@ -310,7 +657,11 @@ class PomodoroView:
         self.menu.add_separator()
         # call internal handler so we can run cleanup before destroying
         self.menu.add_command(label="Quit", command=self._on_quit)
-        self.root.bind("<Button-3>", self.show_menu)
+
+    def _update_menu_state(self) -> None:
+        # runs each time the menu is posted; "Select Task" needs a task list
+        state = "normal" if self.model.num_tasks else "disabled"
+        self.menu.entryconfigure("Select Task", state=state)
 
     def _on_quit(self) -> None:
         """
@@ -318,7 +669,7 @@ class PomodoroView:
         set_on_quit_callback) call it first so it can save state, then
         ensure the window is destroyed.
         """
-        cb = getattr(self, "_on_quit_callback", None)
+        cb = self._on_quit_callback
         if callable(cb):
             try:
                 cb()
@@ -339,24 +690,75 @@ class PomodoroView:
         self._on_quit_callback = callback
 
     def show_menu(self, event: tk.Event) -> None:
+        self.create_right_click_menu()
         try:
             self.menu.tk_popup(event.x_root, event.y_root)
         finally:
             self.menu.grab_release()
 
     def update_display(self) -> None:
-        mins, secs = divmod(self.model.remaining_time, 60)
-        self.time_label.config(text=f"{mins:02d}:{secs:02d}")
-        self.state_label.config(text=self.model.pomodoro_cycle[self.model.current_state_index])
-        self.task_label.config(text=self.model.current_task)
+        model = self.model
+        remaining: int = model.remaining_time
+        # the time text is a pure function of remaining_time: key the cache on the int
+        if remaining != self._last_shown_time:
+            if 0 <= remaining < len(_MMSS):
+                time_text: str = _MMSS[remaining]
+            else:
+                time_text = _MMSS_EXTRA.get(remaining)
+                if time_text is None:
+                    mins, secs = divmod(remaining, 60)
+                    time_text = _MMSS_EXTRA[remaining] = f"{mins:02d}:{secs:02d}"
+            self.time_var.set(time_text)
+            self._last_shown_time = remaining
+        state_text: str = model.pomodoro_cycle[model.current_state_index]
+        if state_text != self._last_state_text:
+            self.state_var.set(state_text)
+            self._last_state_text = state_text
+        task_text: str = model.current_task
+        if task_text != self._last_task_text:
+            self.task_var.set(task_text)
+            self._last_task_text = task_text
 
     def update_timer(self) -> None:
-        if self.model.is_running and self.model.remaining_time > 0:
-            self.model.remaining_time -= 1
-            self.update_display()
-        elif self.model.is_running and self.model.remaining_time == 0:
+        """
+        Refresh the countdown from the model's monotonic deadline and schedule
+        the next tick on the following whole-second boundary.
+        """
+        self._tick_id = None
+        model = self.model
+        if not model.is_running:
+            return
+        rem: float = model.time_left()
+        if rem <= 0:
             self.next_pomodoro()
-        self.root.after(1000, self.update_timer)
+            rem = model.time_left()
+        model.remaining_time = ceil(rem)
+        if model.remaining_time != self._last_shown_time:
+            self.update_display()
+        self._tick_id = self._schedule_tick(self._next_tick_delay(rem))
+
+    @staticmethod
+    def _next_tick_delay(rem: float) -> int:
+        """Milliseconds until the countdown crosses its next whole second."""
+        # zero-length states would otherwise spin; fall back to a plain 1 s tick
+        return int((rem - floor(rem)) * 1000) + 5 if rem > 0 else 1000
+
+    def _start_timer(self) -> None:
+        """Start the model's countdown and make sure a tick is pending."""
+        self.model.start()
+        if self._tick_id is None:
+            self._tick_id = self._schedule_tick(self._next_tick_delay(self.model.time_left()))
+
+    def _cancel_timer(self) -> None:
+        """Drop the pending tick, if any."""
+        if self._tick_id is not None:
+            # not root.after_cancel(): it would also delete the shared command
+            self._tk_call('after', 'cancel', self._tick_id)
+            self._tick_id = None
+
+    def _schedule_tick(self, delay_ms: int) -> str:
+        """Run update_timer after delay_ms via the pre-registered Tcl command."""
+        return self._tk_call('after', delay_ms, self._timer_command)
 
     def _flash_bg(self, duration_ms: int = 160) -> None:
         """
@@ -364,7 +766,7 @@ class PomodoroView:
         The overlay is removed after duration_ms milliseconds.
         """
         # if there's already a flash in progress, don't start another
-        if getattr(self, "_flash_overlay", None) is not None:
+        if self._flash_overlay is not None:
             return
         overlay = tk.Frame(self.root, bg="black")
         overlay.place(relx=0, rely=0, relwidth=1, relheight=1)
@@ -374,7 +776,7 @@ class PomodoroView:
         self.root.after(duration_ms, self._remove_flash)
 
     def _remove_flash(self) -> None:
-        overlay = getattr(self, "_flash_overlay", None)
+        overlay = self._flash_overlay
         if overlay is not None:
             try:
                 overlay.destroy()
@@ -416,7 +818,10 @@ class PomodoroView:
         # If nothing else worked, do nothing (bell was already attempted).
 
     def next_pomodoro(self) -> None:
+        # a new Work session counts one pomodoro against the current task
+        counted_index: int = self.model.current_task_index
         self.model.get_next_state()
+        self._show_task_count(counted_index)
         # play alert sound and flash the window to indicate a state change
         try:
             self._play_alert()
@@ -426,13 +831,61 @@ class PomodoroView:
         self.update_display()
 
     def pause_pomodoro(self) -> None:
-        self.model.toggle_pause()
+        if self.model.is_running:
+            self.model.toggle_pause()
+            self._cancel_timer()
+        else:
+            self._start_timer()
+
+
+
+    @staticmethod
+    def _window_alive(window: Optional[tk.Toplevel]) -> bool:
+        """True if a cached secondary window can be shown again."""
+        return window is not None and bool(window.winfo_exists())
 
+    @classmethod
+    def _window_shown(cls, window: Optional[tk.Toplevel]) -> bool:
+        """
+        True if a cached secondary window is open, even if minimised. Only
+        withdrawn (closed) windows are refreshed when they are reopened.
+        """
+        return cls._window_alive(window) and window.state() != "withdrawn"
 
+    def _create_window(self, title: str) -> tk.Toplevel:
+        """
+        Create a secondary window unmapped, so it can be filled and laid out
+        before it is first shown (see _map_new_window). Closing it only hides
+        it for reuse.
+        """
+        window: tk.Toplevel = tk.Toplevel(self.root)
+        window.withdraw()
+        window.title(title)
+        window.protocol("WM_DELETE_WINDOW", window.withdraw)
+        return window
+
+    def _map_new_window(self, window: tk.Toplevel) -> None:
+        """Settle the geometry of a freshly built window once, then show it."""
+        window.update_idletasks()
+        self._show_window(window)
+
+    @staticmethod
+    def _show_window(window: tk.Toplevel) -> None:
+        """Bring a withdrawn (or buried) secondary window back to the front."""
+        window.deiconify()
+        window.lift()
 
     def open_task_list(self) -> None:
-        self.task_window = tk.Toplevel(self.root)
-        self.task_window.title("Task List")
+        if self._window_alive(self.task_window):
+            # an open window may hold unsaved edits; only a closed one is refreshed
+            if not self._window_shown(self.task_window):
+                self.populate_spreadsheet()
+            self._show_window(self.task_window)
+            return
+
+        # build and fill the window while it is unmapped so it is laid out
+        # and painted once, instead of after every widget/row is added
+        self.task_window = self._create_window("Task List")
         self.spreadsheet = self.create_spreadsheet(self.task_window, 20, 2)
         self.populate_spreadsheet()
         
@@ -442,117 +895,266 @@ class PomodoroView:
         tk.Button(button_frame, text="Save to CSV", command=self.save_to_csv).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="Load from CSV", command=self.load_from_csv).pack(side=tk.LEFT, padx=5)
 
-    def create_spreadsheet(self, parent: tk.Toplevel, rows: int, cols: int) -> List[List[tk.Entry]]:
+        self._map_new_window(self.task_window)
+
+    def create_spreadsheet(self, parent: tk.Toplevel, rows: int, cols: int) -> ttk.Treeview:
+        """
+        Build the task table as a single Treeview showing at least `rows` rows.
+        Cells are edited in place by double-clicking them.
+        """
         spreadsheet_frame: tk.Frame = tk.Frame(parent)
-        spreadsheet_frame.pack(padx=10, pady=10)
-        grid: List[List[tk.Entry]] = []
-        headers: List[str] = ["Task Name", "Pomodoros"]
-        for j, header in enumerate(headers):
-            tk.Label(spreadsheet_frame, text=header, font=('Helvetica', 10, 'bold')).grid(row=0, column=j, sticky='nsew')
-        for i in range(1, rows + 1):
-            row: List[tk.Entry] = []
-            for j in range(cols):
-                entry: tk.Entry = tk.Entry(spreadsheet_frame, width=25)
-                entry.grid(row=i, column=j, sticky='nsew')
-                row.append(entry)
-            grid.append(row)
-        return grid
+        spreadsheet_frame.pack(padx=10, pady=10, fill="both", expand=True)
+        columns: Tuple[str, ...] = ("name", "pomodoros")[:cols]
+        tree: ttk.Treeview = ttk.Treeview(spreadsheet_frame, columns=columns, show="headings",
+                                          height=rows, selectmode="browse")
+        for column, header in zip(columns, CSV_HEADER):
+            tree.heading(column, text=header)
+            tree.column(column, width=180, stretch=True)
+        scrollbar = tk.Scrollbar(spreadsheet_frame, orient=tk.VERTICAL, command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.pack(side=tk.LEFT, fill="both", expand=True)
+        tree.bind("<Double-1>", self._on_cell_double_click)
+
+        self._spreadsheet_rows = rows
+        self._spreadsheet_dirty = False
+        self._edited_cells.clear()
+        # the previous editor (if any) died with its window
+        self._cell_editor = None
+        self._cell_target = None
+        return tree
 
     def populate_spreadsheet(self) -> None:
         if not self.spreadsheet:
             return
-        for row_entries in self.spreadsheet:
-            for entry in row_entries:
-                entry.delete(0, tk.END)
-        for i, (task_name, pomodoros) in enumerate(self.model.task_list):
-            if i < len(self.spreadsheet):
-                self.spreadsheet[i][0].insert(0, task_name)
-                self.spreadsheet[i][1].insert(0, pomodoros)
+        # drop an edit in progress; its cell may be rewritten or removed below
+        self._finish_cell_edit(commit=False)
+        tree: ttk.Treeview = self.spreadsheet
+        rows: List[Tuple[str, str]] = [(name, str(count)) for name, count in self.model.iter_tasks()]
+        # pad with blank rows to type new tasks into, always leaving at least one
+        rows.extend([("", "")] * max(1, self._spreadsheet_rows - len(rows)))
+        # a freshly created tree has nothing to compare against
+        children: Tuple[str, ...] = tree.get_children() if self._spreadsheet_dirty else ()
+        self._spreadsheet_dirty = True
+        self._edited_cells.clear()
+        # rewrite only the rows whose text changed, then trim or extend the tree
+        item, splitlist = tree.item, tree.tk.splitlist
+        for iid, values in zip(children, rows):
+            if tuple(map(str, splitlist(item(iid, "values")))) != values:
+                item(iid, values=values)
+        if len(children) > len(rows):
+            tree.delete(*children[len(rows):])
+        for values in rows[len(children):]:
+            tree.insert("", tk.END, values=values)
+
+    def _show_task_count(self, index: int) -> None:
+        """
+        Copy the model's pomodoro count for task index into its spreadsheet
+        row, so the tree keeps matching the model while the timer runs. A
+        count the user has typed into that cell is left alone.
+        """
+        tree = self.spreadsheet
+        if not tree or not 0 <= index < self.model.num_tasks or not self._window_alive(self.task_window):
+            return
+        children: Tuple[str, ...] = tree.get_children()
+        if index >= len(children):
+            return
+        iid: str = children[index]
+        name, count = self.model.task_at(index)
+        # skip typed-over counts, and rows that no longer show this task
+        # (renamed in the sheet, or reordered in the select-task window)
+        if (iid, "pomodoros") in self._edited_cells or str(tree.set(iid, "name")) != name:
+            return
+        if str(tree.set(iid, "pomodoros")) != str(count):
+            tree.set(iid, "pomodoros", str(count))
+
+    def _on_cell_double_click(self, event: tk.Event) -> None:
+        """Place the shared cell editor over the double-clicked cell."""
+        tree = self.spreadsheet
+        if not tree:
+            return
+        iid: str = tree.identify_row(event.y)
+        column: str = tree.identify_column(event.x)
+        if not iid or not column:
+            return
+        bbox = tree.bbox(iid, column)
+        if not bbox:
+            return
+        if not self._finish_cell_edit(commit=True):
+            return
+        if self._cell_editor is None:
+            self._cell_editor = tk.Entry(tree)
+            self._cell_editor.bind("<Return>", lambda e: self._finish_cell_edit(commit=True))
+            self._cell_editor.bind("<FocusOut>", lambda e: self._finish_cell_edit(commit=True))
+            self._cell_editor.bind("<Escape>", lambda e: self._finish_cell_edit(commit=False))
+        editor: tk.Entry = self._cell_editor
+        x, y, width, height = bbox
+        editor.delete(0, tk.END)
+        editor.insert(0, str(tree.set(iid, column)))
+        editor.place(x=x, y=y, width=width, height=height)
+        editor.focus_set()
+        editor.select_range(0, tk.END)
+        self._cell_target = (iid, column)
+
+    def _finish_cell_edit(self, commit: bool) -> bool:
+        """
+        Hide the cell editor, writing its text back to the cell if commit is set.
+        Returns False if the typed value was rejected and the editor stays open.
+        """
+        editor, target = self._cell_editor, self._cell_target
+        if editor is None or target is None or not self.spreadsheet:
+            return True
+        if commit:
+            tree: ttk.Treeview = self.spreadsheet
+            iid, column = target
+            value: str = editor.get().strip()
+            if value and tree.column(column, "id") == "pomodoros":
+                # counts are validated and normalised once, as they are typed;
+                # isdecimal() (unlike isdigit()) only accepts what int() parses
+                try:
+                    count: int = int(value) if value.isdecimal() else -1
+                except ValueError:  # longer than int()'s digit limit
+                    count = -1
+                if not 0 <= count <= _MAX_POMODOROS:
+                    # keep the editor on the cell so the value can be fixed
+                    self.root.bell()
+                    editor.select_range(0, tk.END)
+                    return False
+                value = str(count)
+            if value != str(tree.set(iid, column)):
+                tree.set(iid, column, value)
+                self._edited_cells.add((iid, tree.column(column, "id")))
+            # keep a blank row available at the bottom for the next task
+            if value and not tree.next(iid):
+                tree.insert("", tk.END, values=("", ""))
+        self._cell_target = None
+        editor.place_forget()
+        return True
 
     def save_to_csv(self) -> None:
+        # an invalid count is still in the editor: save nothing until it is fixed
+        if not self._finish_cell_edit(commit=True):
+            return
+        if not self._edited_cells:
+            # the tree still shows exactly the model's tasks: skip reading it back
+            tasks: List[List[str | int]] = self.model.task_list
+        else:
+            tree: ttk.Treeview = self.spreadsheet
+            tasks = []
+            # hoist the per-row lookups out of the loop
+            item, splitlist, append = tree.item, tree.tk.splitlist, tasks.append
+            for iid in tree.get_children():
+                row = splitlist(item(iid, "values"))
+                if len(row) != 2:
+                    continue
+                name, count = str(row[0]), str(row[1])
+                # skip blank rows and rows whose pomodoro count is not a number
+                if not name or not count:
+                    continue
+                try:
+                    append([name, int(count)])
+                except ValueError:
+                    continue
+            self.model.task_list = tasks
+            self._edited_cells.clear()
 
-        tasks: List[List[str | int]] = []
-        for row in self.spreadsheet:
-            if len(row) != 2:
-                raise ValueError("CSV format incorrect. Each row must have a task name and a number of pomodoros.")
-            curr_task : List[List[str | int]] = []
-            isValid : bool = True
-            for entry in row:
-                cellVal : str = entry.get()
-                if len(cellVal) == 0:
-                    isValid = False
-                curr_task.append(cellVal)
-
-            if isValid:
-                tasks.append([curr_task[0], int(curr_task[1])])
-
-        self.model.task_list = tasks
         if not tasks:
             messagebox.showwarning("Empty List", "Task list is empty. Nothing to save.")
             return
+        if self._save_tasks_as(tasks):
+            if self.model.current_task_index >= len(tasks): self.model.select_task(0)
+            self.update_display()
+            self._start_timer()
+
+    def _save_tasks_as(self, tasks: Iterable[Iterable[Any]]) -> bool:
+        """
+        Ask for a CSV path and write tasks to it in the background. Returns
+        True if a path was chosen; once the write succeeds the file becomes
+        the task file saved on exit.
+        """
         file_path: str = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
-        if file_path:
-            try:
-                with open(file_path, 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(["Task Name", "Pomodoros"])
-                    writer.writerows(tasks)
-                self.tasks_filename = file_path
+        if not file_path:
+            return False
 
-                if self.model.current_task_index >= len(tasks): self.model.select_task(0)
-                self.update_display()
-                self.model.start()
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not save file: {e}")
+        def on_saved() -> None:
+            self.tasks_filename = file_path
+        self._write_in_background(file_path, _format_tasks_csv(tasks), on_saved)
+        return True
+
+    def _write_in_background(self, path: str, data: Union[str, bytes], on_saved: Callable[[], None]) -> None:
+        """
+        Write data to path on the I/O thread. on_saved runs on the Tk thread
+        once the write succeeded; a failure is reported with an error dialog.
+        """
+        self._run_in_background(_write_if_changed, (path, data), lambda _: on_saved(), "Could not save file")
+
+    def _run_in_background(self, func: Callable[..., Any], args: Tuple[Any, ...],
+                           on_done: Callable[[Any], None], error_text: str) -> None:
+        """
+        Run func(*args) on the I/O thread while the timer keeps ticking.
+        on_done gets the result on the Tk thread; a failure of either step is
+        reported with an error dialog starting with error_text.
+        """
+        future = _IO_POOL.submit(func, *args)
+
+        def poll() -> None:
+            if not future.done():
+                self.root.after(50, poll)
+                return
+            try:
+                # applying the result (e.g. a malformed config) can fail too
+                on_done(future.result())
+            except Exception as error:
+                messagebox.showerror("Error", f"{error_text}: {error}")
+        self.root.after(50, poll)
 
-        
     def load_from_existing_csv(self, file_path: str) -> None:
-        tasks: List[List[str | int]] = []
-        with open(file_path, 'r', newline='') as f:
-            reader = csv.reader(f)
-            next(reader)
-            for row in reader:
-                if len(row) != 2 or not row[1].isdigit():
-                    raise ValueError("CSV format incorrect. Each row must have a task name and a number of pomodoros.")
-                tasks.append([row[0], int(row[1])])
-        self.model.task_list = tasks
-        # only populate spreadsheet if it exists (task list window may not be open at startup)
-        if self.spreadsheet:
+        # on a malformed file this raises before the current task list is replaced
+        self._use_tasks(file_path, _read_task_file(file_path))
+
+    def _use_tasks(self, file_path: str, rows: Iterable[Tuple[str, int]]) -> None:
+        """
+        Replace the task list with rows read from file_path and refresh the views.
+        """
+        self.model.task_list = rows
+        # refresh only open windows; closed ones are refreshed when reopened
+        if self.spreadsheet and self._window_shown(self.task_window):
             self.populate_spreadsheet()
-        # update the listbox view if the task-list window is open
-        if self.task_listbox:
+        if self.task_listbox and self._window_shown(self._select_window):
             self._populate_task_listbox()
-        self.model.select_task(0) if tasks else self.model.reset_pomodoro()
+        self.model.select_task(0) if self.model.num_tasks else self.model.reset_pomodoro()
         self.update_display()
-        self.model.start()
+        self._start_timer()
         self.tasks_filename = file_path
 
     def load_from_csv(self) -> None:
         file_path: str = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
         if file_path:
-            try:
-                self.load_from_existing_csv(file_path)
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not load file: {e}")
+            # read and parse on the I/O thread; the rows are applied once ready
+            self._run_in_background(_read_task_file, (file_path,),
+                                    lambda rows: self._use_tasks(file_path, rows), "Could not load file")
 
     def select_task_window(self) -> None:
         """
         Open a task-list window with a reorderable Listbox. Drag items with
         the mouse to reorder the tasks; changes update model.task_list.
         """
-        if not self.model.task_list:
-            messagebox.showinfo("No Tasks", "Please create or load a task list first.")
+        # the menu entry is disabled while there are no tasks
+        if not self.model.num_tasks:
             return
-            
-        
-        self.task_window = tk.Toplevel(self.root)
-        self.task_window.title("Task List")
 
-        frame: tk.Frame = tk.Frame(self.task_window)
+        if self._window_alive(self._select_window):
+            self._populate_task_listbox()
+            self._show_window(self._select_window)
+            return
+
+        self._select_window = self._create_window("Task List")
+
+        frame: tk.Frame = tk.Frame(self._select_window)
         frame.pack(padx=10, pady=10, fill="both", expand=True)
 
         scrollbar = tk.Scrollbar(frame, orient=tk.VERTICAL)
-        self.task_listbox = tk.Listbox(frame, width=50, height=15, yscrollcommand=scrollbar.set)
+        self.task_listbox = tk.Listbox(frame, width=50, height=15, activestyle='none', yscrollcommand=scrollbar.set)
         scrollbar.config(command=self.task_listbox.yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.task_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -565,7 +1167,7 @@ class PomodoroView:
         self.task_listbox.bind("<B1-Motion>", self._on_task_motion)
         self.task_listbox.bind("<ButtonRelease-1>", self._on_task_release)
 
-        button_frame: tk.Frame = tk.Frame(self.task_window)
+        button_frame: tk.Frame = tk.Frame(self._select_window)
         button_frame.pack(pady=5)
 
         def on_select() -> None:
@@ -573,24 +1175,22 @@ class PomodoroView:
             if selected_indices:
                 self.model.select_task(selected_indices[0])
                 self.update_display()
-                self.task_window.destroy()
-                self.model.start()
+                self._select_window.withdraw()
+                self._start_timer()
         tk.Button(button_frame, text="Save to CSV", command=self._save_tasklist_to_csv).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="Select", command=on_select).pack(side=tk.LEFT, padx=5)
-    
+        self._map_new_window(self._select_window)
 
     def _populate_task_listbox(self) -> None:
-        """Fill the task-list Listbox from model.task_list."""
+        """Fill the task-list Listbox from the model's tasks."""
         if not self.task_listbox:
             return
         self.task_listbox.delete(0, tk.END)
-        for task in self.model.task_list:
-            # each task is [name, count]
-            try:
-                display = f"{task[0]} ({task[1]} Pomodoros)"
-            except Exception:
-                display = str(task)
-            self.task_listbox.insert(tk.END, display)
+        # insert rows in as few Tcl calls as possible, chunked so a huge list
+        # does not build one enormous argument vector
+        items: List[str] = [f"{name} ({count} Pomodoros)" for name, count in self.model.iter_tasks()]
+        for start in range(0, len(items), 1000):
+            self.task_listbox.insert(tk.END, *items[start:start + 1000])
 
     def _on_task_press(self, event: tk.Event) -> None:
         """Start dragging the listbox row under the pointer."""
@@ -620,8 +1220,7 @@ class PomodoroView:
 
         # move item in underlying model.task_list if indices valid
         try:
-            task = self.model.task_list.pop(self._task_drag_index)
-            self.model.task_list.insert(target, task)
+            self.model.move_task(self._task_drag_index, target)
         except Exception:
             pass
 
@@ -632,30 +1231,39 @@ class PomodoroView:
         """Finish drag operation."""
         self._task_dragging = False
         self._task_drag_index = None
+        # keep an unedited spreadsheet in the model's new order
+        if not self._edited_cells and self._window_alive(self.task_window):
+            self.populate_spreadsheet()
         # refresh display and ensure current selection stays valid
         self.update_display()
 
     def _save_tasklist_to_csv(self) -> None:
-        """Save model.task_list to CSV via file dialog (used by task-list window)."""
-        tasks = self.model.task_list
-        if not tasks:
+        """Save the model's tasks to CSV via file dialog (used by task-list window)."""
+        if not self.model.num_tasks:
             messagebox.showwarning("Empty List", "Task list is empty. Nothing to save.")
             return
-        file_path: str = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
-        if not file_path:
+        self._save_tasks_as(self.model.iter_tasks())
+
+    def _refresh_settings_vars(self) -> None:
+        """Copy the model's current settings into the settings window fields."""
+        if self._settings_vars is None:
             return
-        try:
-            with open(file_path, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Task Name", "Pomodoros"])
-                writer.writerows(tasks)
-            self.tasks_filename = file_path
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not save file: {e}")
+        work_var, short_break_var, long_break_var, num_cyc_before_long_break_var = self._settings_vars
+        work_var.set(str(self.model.work_duration // 60))
+        short_break_var.set(str(self.model.short_break_duration // 60))
+        long_break_var.set(str(self.model.long_break_duration // 60))
+        num_cyc_before_long_break_var.set(str(self.model.num_cyc_before_long_break))
 
     def open_settings_window(self) -> None:
-        settings_window: tk.Toplevel = tk.Toplevel(self.root)
-        settings_window.title("Settings")
+        if self._window_alive(self._settings_window):
+            # keep values typed into an open window that were not applied yet
+            if not self._window_shown(self._settings_window):
+                self._refresh_settings_vars()
+            self._show_window(self._settings_window)
+            return
+
+        settings_window: tk.Toplevel = self._create_window("Settings")
+        self._settings_window = settings_window
         settings_window.attributes("-topmost", True)
         settings_window.geometry("300x230")
         
@@ -667,11 +1275,12 @@ class PomodoroView:
         tk.Label(frame, text="Long Break (min):").grid(row=2, column=0, sticky='w', pady=5)
         tk.Label(frame, text="Num Cycles Before Long Break:").grid(row=3, column=0, sticky='w', pady=5)
         
-        work_var: tk.StringVar = tk.StringVar(value=str(self.model.work_duration // 60))
-        short_break_var: tk.StringVar = tk.StringVar(value=str(self.model.short_break_duration // 60))
-        long_break_var: tk.StringVar = tk.StringVar(value=str(self.model.long_break_duration // 60))
-        long_break_var: tk.StringVar = tk.StringVar(value=str(self.model.long_break_duration // 60))
-        num_cyc_before_long_break_var: tk.StringVar = tk.StringVar(value=str(self.model.num_cyc_before_long_break))
+        work_var: tk.StringVar = tk.StringVar()
+        short_break_var: tk.StringVar = tk.StringVar()
+        long_break_var: tk.StringVar = tk.StringVar()
+        num_cyc_before_long_break_var: tk.StringVar = tk.StringVar()
+        self._settings_vars = (work_var, short_break_var, long_break_var, num_cyc_before_long_break_var)
+        self._refresh_settings_vars()
         
         tk.Entry(frame, textvariable=work_var, width=10).grid(row=0, column=1)
         tk.Entry(frame, textvariable=short_break_var, width=10).grid(row=1, column=1)
@@ -679,38 +1288,55 @@ class PomodoroView:
         tk.Entry(frame, textvariable=num_cyc_before_long_break_var, width=10).grid(row=3, column=1)
 
         def apply_settings(from_load: bool = False) -> None:
+            fields: List[str] = [var.get().strip() for var in self._settings_vars]
+            # validate up front (positive whole numbers) instead of relying on
+            # int() raising halfway through updating the model
             try:
-                self.model.work_duration = int(work_var.get()) * 60
-                self.model.short_break_duration = int(short_break_var.get()) * 60
-                self.model.long_break_duration = int(long_break_var.get()) * 60
-                self.model.num_cyc_before_long_break = int(num_cyc_before_long_break_var.get())
-                self.model.pomodoro_cycle =  ["Work", "Short Break"]*self.model.num_cyc_before_long_break
-                self.model.pomodoro_cycle.append("Long Break")
+                # int() can still fail on a decimal string past its digit limit
+                values: List[int] = [int(field) if field.isdecimal() else 0 for field in fields]
+            except ValueError:
+                values = [0]
+            if not all(value > 0 for value in values):
+                messagebox.showerror("Invalid Input", "Please enter valid numbers.")
+                return
+            work, short_break, long_break, num_cycles = values
+            settings: Tuple[int, int, int, int] = (work * 60, short_break * 60, long_break * 60, num_cycles)
+            current: Tuple[int, int, int, int] = (self.model.work_duration, self.model.short_break_duration,
+                                                  self.model.long_break_duration, self.model.num_cyc_before_long_break)
+            # unchanged settings keep the running cycle instead of resetting it
+            if settings != current:
+                (self.model.work_duration, self.model.short_break_duration,
+                 self.model.long_break_duration, self.model.num_cyc_before_long_break) = settings
+                self.model.build_cycle()
                 self.model.reset_pomodoro()
+                self._cancel_timer()
                 self.update_display()
-                if not from_load: settings_window.destroy()
-            except ValueError: messagebox.showerror("Invalid Input", "Please enter valid numbers.")
+            if not from_load: settings_window.withdraw()
         
         def save_config() -> None:
             data = {'work': work_var.get(), 'short': short_break_var.get(), 'long': long_break_var.get(), 'numcycles': num_cyc_before_long_break_var.get()}
             path: str = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
             if path:
-                with open(path, 'w') as f: json.dump(data, f, indent=4)
-                self.config_filename = path
+                def on_saved() -> None:
+                    self.config_filename = path
+                self._write_in_background(path, _dump_json(data), on_saved)
 
         def load_config() -> None:
             path: str = filedialog.askopenfilename(filetypes=[("JSON files", "*.json")])
             if path:
-                with open(path, 'r') as f: data = json.load(f)
-                work_var.set(data['work'])
-                short_break_var.set(data['short'])
-                long_break_var.set(data['long'])
-                num_cyc_before_long_break_var.set(data['numcycles'])
-                apply_settings(from_load=True)
+                self._run_in_background(_read_json_file, (path,), use_config, "Could not load file")
+
+        def use_config(data: Any) -> None:
+            work_var.set(data['work'])
+            short_break_var.set(data['short'])
+            long_break_var.set(data['long'])
+            num_cyc_before_long_break_var.set(data['numcycles'])
+            apply_settings(from_load=True)
 
         tk.Button(frame, text="Apply", command=apply_settings).grid(row=4, column=0, columnspan=2, pady=10)
         tk.Button(frame, text="Save Config", command=save_config).grid(row=5, column=0, pady=5, sticky='ew')
         tk.Button(frame, text="Load Config", command=load_config).grid(row=5, column=1, pady=5, sticky='ew')
+        self._map_new_window(settings_window)
 
 if __name__ == "__main__":
     root: tk.Tk = tk.Tk()
@@ -722,6 +1348,9 @@ if __name__ == "__main__":
 
     def on_close() -> None:
         """Save config.json and tasks.csv in the current folder, then exit."""
+        # let any save still running in the background finish first
+        _IO_POOL.shutdown(wait=True)
+
         # Save config.json (store durations in minutes as strings to match GUI format)
         try:
             config_data = {
@@ -730,24 +1359,13 @@ if __name__ == "__main__":
                 'long': str(pomodoro_model.long_break_duration // 60),
                 'numcycles': str(pomodoro_model.num_cyc_before_long_break),
             }
-            with open(pomodoro_view.config_filename, "w") as f:
-                json.dump(config_data, f, indent=4)
+            _write_if_changed(pomodoro_view.config_filename, _dump_json(config_data))
         except Exception as e:
             print(f"Error saving config.json: {e}")
 
-        # Save tasks.csv (only non-empty task list entries)
+        # Save tasks.csv
         try:
-            tasks = pomodoro_model.task_list
-            with open(pomodoro_view.tasks_filename, "w", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerow(["Task Name", "Pomodoros"])
-                for row in tasks:
-                    # Expect rows like [name, count]
-                    if not row:
-                        continue
-                    name = str(row[0])
-                    count = row[1] if len(row) > 1 else ""
-                    writer.writerow([name, count])
+            _write_if_changed(pomodoro_view.tasks_filename, _format_tasks_csv(pomodoro_model.iter_tasks()))
         except Exception as e:
             print(f"Error saving tasks.csv: {e}")
 
@@ -761,29 +1379,32 @@ if __name__ == "__main__":
     pomodoro_view.set_on_quit_callback(on_close)
     root.protocol("WM_DELETE_WINDOW", on_close)
     
-    # Try to load configuration
-    if os.path.exists(pomodoro_view.config_filename):
-        try:
-            with open(pomodoro_view.config_filename, 'r') as f:
-                data : dict = json.load(f)
+    def _deferred_boot() -> None:
+        """Load config.json and tasks.csv once the window has been painted."""
+        # Try to load configuration
+        if os.path.exists(pomodoro_view.config_filename):
+            try:
+                data : dict = _read_json_file(pomodoro_view.config_filename)
                 pomodoro_model.work_duration = int(data['work']) * 60
                 pomodoro_model.short_break_duration = int(data['short']) * 60
                 pomodoro_model.long_break_duration = int(data['long']) * 60
                 pomodoro_model.num_cyc_before_long_break = int(data['numcycles'])
-                pomodoro_model.pomodoro_cycle = ["Work", "Short Break"]*pomodoro_model.num_cyc_before_long_break
-                pomodoro_model.pomodoro_cycle.append("Long Break")
+                pomodoro_model.build_cycle()
                 pomodoro_model.reset_pomodoro()
-                pomodoro_view.update_display()
-        except Exception as e:
-            print(f"Error loading config.json: {e}")
-    
-    # Try to load tasks
-    if os.path.exists(pomodoro_view.tasks_filename):
-        try:
-            # load without requiring the task-window to be open
-            pomodoro_view.load_from_existing_csv(pomodoro_view.tasks_filename)
-        except Exception as e:
-            print(f"Error loading tasks.csv: {e}")
-    
+            except Exception as e:
+                print(f"Error loading config.json: {e}")
+
+        # Try to load tasks
+        if os.path.exists(pomodoro_view.tasks_filename):
+            try:
+                # load without requiring the task-window to be open
+                pomodoro_view.load_from_existing_csv(pomodoro_view.tasks_filename)
+            except Exception as e:
+                print(f"Error loading tasks.csv: {e}")
+
+        pomodoro_view.update_display()
+
+    # Show the window first so file I/O does not delay the first paint
     root.deiconify() 
+    root.after_idle(_deferred_boot)
     root.mainloop()